@@ -1,12 +1,13 @@
 import argparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pprint import pprint
 
 from pymitsubishi import MitsubishiController, PowerOnOff, DriveMode
 
 parser = argparse.ArgumentParser(formatter_class=argparse.ArgumentDefaultsHelpFormatter)
 parser.add_argument('--verbose', '-v', help="Verbose output", action="count", default=0)
-parser.add_argument("host", help="Hostname or IP address to connect to, optionally followed by ':port'")
+parser.add_argument("host", nargs='+', help="Hostname(s) or IP address(es) to connect to, each optionally followed by ':port'")
 parser.add_argument("--power", help="Change power mode", choices=['on', 'off'])
 parser.add_argument("--mode", help="Change mode", choices=[_.name for _ in DriveMode])
 parser.add_argument("--target-temperature", help="Change the target temperature", type=float)
@@ -15,28 +16,43 @@ args = parser.parse_args()
 logging.basicConfig(level=logging.WARNING - 10 * args.verbose)
 logger = logging.getLogger(__name__)
 
-ctrl = MitsubishiController.create(args.host)
-ctrl.fetch_status()
-pprint(ctrl.state.general)
-pprint(ctrl.state.sensors)
-pprint(ctrl.state.energy)
-pprint(ctrl.state.errors)
-
-changes = False
-if args.mode:
-    changes = True
-    ctrl.set_mode(DriveMode[args.mode])
-if args.power:
-    changes = True
-    ctrl.set_power(args.power == 'on')
-if args.target_temperature:
-    changes = True
-    ctrl.set_temperature(args.target_temperature)
-
-if changes:
-    print()
-    print("After changes:")
+
+def print_state(ctrl: MitsubishiController):
     pprint(ctrl.state.general)
     pprint(ctrl.state.sensors)
     pprint(ctrl.state.energy)
     pprint(ctrl.state.errors)
+
+
+def apply_changes(ctrl: MitsubishiController, options: argparse.Namespace) -> bool:
+    changes = False
+    if options.mode:
+        changes = True
+        ctrl.set_mode(DriveMode[options.mode])
+    if options.power:
+        changes = True
+        ctrl.set_power(options.power == 'on')
+    if options.target_temperature:
+        changes = True
+        ctrl.set_temperature(options.target_temperature)
+    return changes
+
+
+controllers = {host: MitsubishiController.create(host) for host in args.host}
+
+# Each controller has its own connection pool, so devices can be talked to concurrently
+with ThreadPoolExecutor(max_workers=len(controllers)) as executor:
+    list(executor.map(lambda ctrl: ctrl.fetch_status(), controllers.values()))
+
+    for host, ctrl in controllers.items():
+        print(f"{host}:")
+        print_state(ctrl)
+
+    changed = list(executor.map(lambda ctrl: apply_changes(ctrl, args), controllers.values()))
+
+if any(changed):
+    print()
+    print("After changes:")
+    for host, ctrl in controllers.items():
+        print(f"{host}:")
+        print_state(ctrl)
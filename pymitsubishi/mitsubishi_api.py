@@ -6,28 +6,76 @@ This module handles all HTTP communication, encryption, and decryption
 for Mitsubishi MAC-577IF-2E devices.
 """
 
-import base64
+import os
 import re
-import requests
-import xml.etree.ElementTree as ET
+import socket
+import urllib3
 from typing import Optional, Dict, Any
 import logging
 
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
-from Crypto.Random import get_random_bytes
-from requests.auth import HTTPBasicAuth
-from requests.adapters import HTTPAdapter, Retry
+from binascii import a2b_base64, b2a_base64
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 
 # Constants from the working implementation
 KEY_SIZE = 16
 STATIC_KEY = b"unregistered\0\0\0\0"
 
+# The /smart response is a fixed single-element envelope: <ESV>base64</ESV>
+_ESV_RE = re.compile(rb'<ESV>([^<]+)</ESV>')
+# <dt>Label</dt><dd>Value</dd> pairs on the /unitinfo page (tags may carry attributes)
+_DT_DD_RE = re.compile(r'<dt(?:\s[^>]*)?>([^<]+)</dt>\s*<dd(?:\s[^>]*)?>([^<]+)</dd>')
+# Numeric part of e.g. "-25dBm"
+_RSSI_RE = re.compile(r'(-?\d+)')
+
+# /unitinfo label -> (section, key, optional converter)
+# When the converter raises ValueError, the raw value is stored under `<key>_raw`
+_UNIT_INFO_FIELDS = {
+    'Adaptor name': ('adaptor_info', 'model', None),
+    'Application version': ('adaptor_info', 'app_version', None),
+    'Release version': ('adaptor_info', 'release_version', None),
+    'Flash version': ('adaptor_info', 'flash_version', None),
+    'Boot version': ('adaptor_info', 'boot_version', None),
+    'Common platform version': ('adaptor_info', 'platform_version', None),
+    'Test release version': ('adaptor_info', 'test_version', None),
+    'MAC address': ('adaptor_info', 'mac_address', None),
+    'ID': ('adaptor_info', 'device_id', int),
+    'Manufacturing date': ('adaptor_info', 'manufacturing_date', None),
+    'Current time': ('adaptor_info', 'current_time', None),
+    'Channel': ('adaptor_info', 'wifi_channel', int),
+    'IT communication status': ('adaptor_info', 'it_comm_status', None),
+    'Server operation': ('adaptor_info', 'server_operation', lambda value: value == 'ON'),
+    'Server communication status': ('adaptor_info', 'server_comm_status', None),
+    'Server communication status(HEMS)': ('adaptor_info', 'hems_comm_status', None),
+    'SOI communication status': ('adaptor_info', 'soi_comm_status', None),
+    'Thermal image timestamp': ('adaptor_info', 'thermal_timestamp', lambda value: value if value != '--' else None),
+    'Unit type': ('unit_info', 'type', None),
+    'IT protocol version': ('unit_info', 'it_protocol_version', None),
+    'Error': ('unit_info', 'error_code', None),
+}
+
+_SOCKET_OPTIONS = [
+    (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),  # Don't let Nagle delay the small request bodies
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
 logger = logging.getLogger(__name__)
 
 
 class MitsubishiAPI:
     """Handles all API communication with Mitsubishi AC devices"""
+
+    # Headers for the /smart endpoint; Host is filled in by urllib3 from the URL
+    _HEADERS = {
+        'Content-Type': 'text/plain; charset=UTF-8',
+        'Connection': 'keep-alive',
+        'Accept': '*/*',
+        'User-Agent': 'KirigamineRemote/5.1.0 (jp.co.MitsubishiElectric.KirigamineRemote; build:3; iOS 17.5.1) Alamofire/5.9.1',
+        'Accept-Language': 'zh-Hant-JP;q=1.0, ja-JP;q=0.9',
+    }
+
+    # Static request payloads
+    _STATUS_XML = b'<CSV><CONNECT>ON</CONNECT></CSV>'
+    _ECHONET_XML = b'<CSV><CONNECT>ON</CONNECT><ECHONET>ON</ECHONET></CSV>'
     
     def __init__(
             self,
@@ -42,114 +90,120 @@ class MitsubishiAPI:
         if len(self.encryption_key) != KEY_SIZE:
             self.encryption_key += (KEY_SIZE - len(self.encryption_key)) * b'\0'  # pad with NULL-bytes
             self.encryption_key = self.encryption_key[0:KEY_SIZE]  # trim when too long
+        # The key is fixed for the lifetime of this object, so the AES algorithm
+        # instance is built once and shared by every encrypt/decrypt call.
+        self._aes = algorithms.AES(self.encryption_key)
 
         self.admin_username = admin_username
         self.admin_password = admin_password
-        self.session = requests.Session()
-
-        retries = Retry(total=2, backoff_factor=1)
-        self.session.mount('http://', HTTPAdapter(max_retries=retries))
-
-    def encrypt_payload(self, payload: str, iv: bytes = None) -> str:
+        # Each API instance talks to exactly one host, so a single pooled connection suffices
+        self._pool = urllib3.PoolManager(
+            num_pools=1,
+            maxsize=1,
+            retries=urllib3.Retry(total=2, backoff_factor=1),
+            socket_options=_SOCKET_OPTIONS,
+        )
+
+    def encrypt_payload(self, payload: str | bytes, iv: bytes = None) -> str:
         """Encrypt payload using same method as TypeScript implementation"""
         if iv is None:  # Allow passing in IV for testing purposes
-            iv = get_random_bytes(KEY_SIZE)
+            iv = os.urandom(KEY_SIZE)
 
-        # Encrypt using AES CBC with zero padding
-        cipher = AES.new(self.encryption_key, AES.MODE_CBC, iv)
-        
-        payload_bytes = payload.encode('utf-8')
-        padded_payload = pad(payload_bytes, KEY_SIZE, 'iso7816')
+        # Encrypt using AES CBC with ISO 7816-4 padding
+        encryptor = Cipher(self._aes, modes.CBC(iv)).encryptor()
 
-        encrypted = cipher.encrypt(padded_payload)
-        
-        return base64.b64encode(iv + encrypted).decode('utf-8')
+        payload_bytes = payload.encode('utf-8') if isinstance(payload, str) else payload
+        padding_length = KEY_SIZE - len(payload_bytes) % KEY_SIZE
+        padded_payload = payload_bytes + b'\x80' + b'\0' * (padding_length - 1)
+
+        # Assemble IV + ciphertext in a single buffer
+        buffer = bytearray(iv)
+        buffer += encryptor.update(padded_payload)
+        buffer += encryptor.finalize()
+
+        return b2a_base64(buffer, newline=False).decode('ascii')
 
     def decrypt_payload(self, payload_b64: str) -> Optional[str]:
-        # Convert base64 to hex string
-        encrypted = base64.b64decode(payload_b64)
+        # Decode base64 to raw bytes
+        encrypted = a2b_base64(payload_b64)
 
-        logger.debug(f"Base64 payload length: {len(payload_b64)}")
+        # Need an IV plus at least one whole ciphertext block
+        if len(encrypted) < 2 * KEY_SIZE or len(encrypted) % KEY_SIZE:
+            logger.error("Invalid encrypted payload length: %d", len(encrypted))
+            return None
 
-        iv = encrypted[:KEY_SIZE]
-        encrypted_data = encrypted[KEY_SIZE:]
+        # Only build the (hex) debug output when someone is listening
+        debug = logger.isEnabledFor(logging.DEBUG)
 
-        logger.debug(f"IV: {iv.hex()}")
+        # Zero-copy views on the IV and ciphertext
+        encrypted_view = memoryview(encrypted)
+        iv = encrypted_view[:KEY_SIZE]
+        encrypted_data = encrypted_view[KEY_SIZE:]
 
-        logger.debug(f"Encrypted data length: {len(encrypted_data)}")
-        logger.debug(f"Encrypted data (first 64 bytes): {encrypted_data[:64].hex()}")
+        if debug:
+            logger.debug("Base64 payload length: %d", len(payload_b64))
+            logger.debug("IV: %s", iv.hex())
+            logger.debug("Encrypted data length: %d", len(encrypted_data))
+            logger.debug("Encrypted data (first 64 bytes): %s", encrypted_data[:64].hex())
 
-        cipher = AES.new(self.encryption_key, AES.MODE_CBC, iv)
-        decrypted = cipher.decrypt(encrypted_data)
+        decryptor = Cipher(self._aes, modes.CBC(iv)).decryptor()
+        decrypted = decryptor.update(encrypted_data) + decryptor.finalize()
 
-        logger.debug(f"Decrypted raw length: {len(decrypted)}")
-        logger.debug(f"Decrypted raw (first 64 bytes): {decrypted[:64]}")
-        logger.debug(f"Decrypted raw (last 64 bytes): {decrypted[-64:]}")
+        if debug:
+            logger.debug("Decrypted raw length: %d", len(decrypted))
+            logger.debug("Decrypted raw (first 64 bytes): %r", decrypted[:64])
+            logger.debug("Decrypted raw (last 64 bytes): %r", decrypted[-64:])
 
-        decrypted_clean = unpad(decrypted, KEY_SIZE, 'iso7816')
+        # Strip ISO 7816-4 padding: trailing NULL-bytes preceded by a single 0x80
+        decrypted_clean = decrypted.rstrip(b'\0')
+        if not decrypted_clean.endswith(b'\x80'):
+            raise ValueError("Invalid ISO 7816-4 padding")
+        decrypted_clean = decrypted_clean[:-1]
 
-        logger.debug(f"After padding removal length: {len(decrypted_clean)}")
-        logger.debug(f"Non-zero bytes at end: {decrypted_clean[-20:]}")
+        if debug:
+            logger.debug("After padding removal length: %d", len(decrypted_clean))
+            logger.debug("Non-zero bytes at end: %r", decrypted_clean[-20:])
 
         # Try to decode as UTF-8
         result = decrypted_clean.decode('utf-8')  # may raise
         return result
 
 
-    def make_request(self, payload_xml: str) -> Optional[str]:
+    def make_request(self, payload_xml: str | bytes) -> Optional[str]:
         """Make HTTP request to the /smart endpoint"""
         # Encrypt the XML payload
         encrypted_payload = self.encrypt_payload(payload_xml)
         
         # Create the full XML request body
-        request_body = f'<?xml version="1.0" encoding="UTF-8"?><ESV>{encrypted_payload}</ESV>'
-        
-        logger.debug("Request Body:")
-        logger.debug(request_body)
-
-        headers = {
-            'Host': f'{self.device_host_port}',
-            'Content-Type': 'text/plain; charset=UTF-8',
-            'Connection': 'keep-alive',
-            'Proxy-Connection': 'keep-alive',
-            'Accept': '*/*',
-            'User-Agent': 'KirigamineRemote/5.1.0 (jp.co.MitsubishiElectric.KirigamineRemote; build:3; iOS 17.5.1) Alamofire/5.9.1',
-            'Accept-Language': 'zh-Hant-JP;q=1.0, ja-JP;q=0.9',
-        }
+        request_body = b'<?xml version="1.0" encoding="UTF-8"?><ESV>' + encrypted_payload.encode('ascii') + b'</ESV>'
         
+        logger.debug("Request Body: %r", request_body)
+
         url = f'http://{self.device_host_port}/smart'
         
         try:
-            response = self.session.post(url, data=request_body, headers=headers, timeout=2)
-            
-            if response.status_code == 200:
-                logger.debug("Response Text:")
-                logger.debug(response.text)
-                try:
-                    root = ET.fromstring(response.text)
-                    encrypted_response = root.text
-                    if encrypted_response:
-                        decrypted = self.decrypt_payload(encrypted_response)
-                        return decrypted
-                except ET.ParseError as e:
-                    logger.error(f"XML parsing error: {e}")
-            
-            return None
-            
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Request error: {e}")
+            response = self._pool.request('POST', url, body=request_body, headers=self._HEADERS, timeout=2.0)
+        except urllib3.exceptions.HTTPError as e:
+            logger.error("Request error: %s", e)
             return None
 
+        if response.status == 200:
+            logger.debug("Response Text: %r", response.data)
+            match = _ESV_RE.search(response.data)
+            if match:
+                return self.decrypt_payload(match.group(1).decode('ascii'))
+            logger.error("No ESV payload found in response")
+
+        return None
+
 
     def send_status_request(self) -> Optional[str]:
         """Send a status request to get current device state"""
-        payload_xml = '<CSV><CONNECT>ON</CONNECT></CSV>'
-        return self.make_request(payload_xml)
+        return self.make_request(self._STATUS_XML)
 
     def send_echonet_enable(self) -> Optional[str]:
         """Send ECHONET enable command"""
-        payload_xml = '<CSV><CONNECT>ON</CONNECT><ECHONET>ON</ECHONET></CSV>'
-        return self.make_request(payload_xml)
+        return self.make_request(self._ECHONET_XML)
 
     def send_hex_command(self, hex_command: str) -> Optional[str]:
         """Send a hex command to the device"""
@@ -160,24 +214,24 @@ class MitsubishiAPI:
         """Get unit information from the /unitinfo endpoint using admin credentials"""
         try:
             url = f'http://{self.device_host_port}/unitinfo'
-            # Use provided password or fall back to instance default
-            auth = HTTPBasicAuth(self.admin_username, self.admin_password)
+            headers = urllib3.make_headers(basic_auth=f'{self.admin_username}:{self.admin_password}')
             
-            logger.debug(f"Fetching unit info from {url}")
+            logger.debug("Fetching unit info from %s", url)
             
-            response = self.session.get(url, auth=auth, timeout=2)
+            response = self._pool.request('GET', url, headers=headers, timeout=2.0)
             
-            if response.status_code == 200:
-                logger.debug(f"Unit info HTML response received ({len(response.text)} chars)")
+            if response.status == 200:
+                html_content = response.data.decode('utf-8', errors='replace')
+                logger.debug("Unit info HTML response received (%d chars)", len(html_content))
                 
                 # Parse the HTML response to extract unit information
-                return self._parse_unit_info_html(response.text)
+                return self._parse_unit_info_html(html_content)
             else:
-                logger.debug(f"Unit info request failed with status {response.status_code}")
+                logger.debug("Unit info request failed with status %d", response.status)
                 return None
                 
-        except requests.exceptions.RequestException as e:
-            logger.debug(f"Unit info request error: {e}")
+        except urllib3.exceptions.HTTPError as e:
+            logger.debug("Unit info request error: %s", e)
             return None
     
     def _parse_unit_info_html(self, html_content: str) -> Dict[str, Any]:
@@ -188,107 +242,45 @@ class MitsubishiAPI:
         }
         
         try:
-            # Extract data using regex patterns to parse the HTML structure
-            # Pattern to match <dt>Label</dt><dd>Value</dd> pairs
-            pattern = r'<dt>([^<]+)</dt>\s*<dd>([^<]+)</dd>'
-            matches = re.findall(pattern, html_content)
-            
-            logger.debug(f"Found {len(matches)} key-value pairs in HTML")
+            # Extract <dt>Label</dt><dd>Value</dd> pairs from the HTML structure
+            matches = _DT_DD_RE.findall(html_content)
             
-            # Determine which section we're in based on the order and known fields
-            adaptor_fields = {
-                'Adaptor name', 'Application version', 'Release version', 'Flash version',
-                'Boot version', 'Common platform version', 'Test release version',
-                'MAC address', 'ID', 'Manufacturing date', 'Current time', 'Channel',
-                'RSSI', 'IT communication status', 'Server operation', 
-                'Server communication status', 'Server communication status(HEMS)',
-                'SOI communication status', 'Thermal image timestamp'
-            }
-            
-            unit_fields = {
-                'Unit type', 'IT protocol version', 'Error'
-            }
+            logger.debug("Found %d key-value pairs in HTML", len(matches))
             
             for key, value in matches:
                 key = key.strip()
                 value = value.strip()
-                
-                if key in adaptor_fields:
-                    # Convert specific fields to appropriate types
-                    if key == 'RSSI':
-                        # Extract numeric value from "-25dBm" format
-                        rssi_match = re.search(r'(-?\d+)', value)
-                        if rssi_match:
-                            unit_info['adaptor_info']['rssi_dbm'] = int(rssi_match.group(1))
-                        unit_info['adaptor_info']['rssi_raw'] = value
-                    elif key == 'Channel':
-                        try:
-                            unit_info['adaptor_info']['wifi_channel'] = int(value)
-                        except ValueError:
-                            unit_info['adaptor_info']['wifi_channel_raw'] = value
-                    elif key == 'ID':
-                        try:
-                            unit_info['adaptor_info']['device_id'] = int(value)
-                        except ValueError:
-                            unit_info['adaptor_info']['device_id_raw'] = value
-                    elif key == 'MAC address':
-                        unit_info['adaptor_info']['mac_address'] = value
-                    elif key == 'Manufacturing date':
-                        unit_info['adaptor_info']['manufacturing_date'] = value
-                    elif key == 'Current time':
-                        unit_info['adaptor_info']['current_time'] = value
-                    elif key == 'Adaptor name':
-                        unit_info['adaptor_info']['model'] = value
-                    elif key == 'Application version':
-                        unit_info['adaptor_info']['app_version'] = value
-                    elif key == 'Release version':
-                        unit_info['adaptor_info']['release_version'] = value
-                    elif key == 'Flash version':
-                        unit_info['adaptor_info']['flash_version'] = value
-                    elif key == 'Boot version':
-                        unit_info['adaptor_info']['boot_version'] = value
-                    elif key == 'Common platform version':
-                        unit_info['adaptor_info']['platform_version'] = value
-                    elif key == 'Test release version':
-                        unit_info['adaptor_info']['test_version'] = value
-                    elif key == 'IT communication status':
-                        unit_info['adaptor_info']['it_comm_status'] = value
-                    elif key == 'Server operation':
-                        unit_info['adaptor_info']['server_operation'] = value == 'ON'
-                    elif key == 'Server communication status':
-                        unit_info['adaptor_info']['server_comm_status'] = value
-                    elif key == 'Server communication status(HEMS)':
-                        unit_info['adaptor_info']['hems_comm_status'] = value
-                    elif key == 'SOI communication status':
-                        unit_info['adaptor_info']['soi_comm_status'] = value
-                    elif key == 'Thermal image timestamp':
-                        unit_info['adaptor_info']['thermal_timestamp'] = value if value != '--' else None
-                    else:
-                        # Fallback: store with normalized key
-                        normalized_key = key.lower().replace(' ', '_').replace('(', '').replace(')', '')
-                        unit_info['adaptor_info'][normalized_key] = value
-                        
-                elif key in unit_fields:
-                    if key == 'Unit type':
-                        unit_info['unit_info']['type'] = value
-                    elif key == 'IT protocol version':
-                        unit_info['unit_info']['it_protocol_version'] = value
-                    elif key == 'Error':
-                        unit_info['unit_info']['error_code'] = value
-                    else:
-                        # Fallback: store with normalized key
-                        normalized_key = key.lower().replace(' ', '_')
-                        unit_info['unit_info'][normalized_key] = value
+
+                if key == 'RSSI':
+                    # Extract numeric value from "-25dBm" format
+                    rssi_match = _RSSI_RE.search(value)
+                    if rssi_match:
+                        unit_info['adaptor_info']['rssi_dbm'] = int(rssi_match.group(1))
+                    unit_info['adaptor_info']['rssi_raw'] = value
+                    continue
+
+                field = _UNIT_INFO_FIELDS.get(key)
+                if field is None:
+                    continue
+                section, name, convert = field
+
+                if convert is None:
+                    unit_info[section][name] = value
+                else:
+                    try:
+                        unit_info[section][name] = convert(value)
+                    except ValueError:
+                        unit_info[section][f'{name}_raw'] = value
             
-            logger.debug(f"Parsed unit info: {len(unit_info['adaptor_info'])} adaptor fields, {len(unit_info['unit_info'])} unit fields")
+            logger.debug("Parsed unit info: %d adaptor fields, %d unit fields",
+                         len(unit_info['adaptor_info']), len(unit_info['unit_info']))
             
             return unit_info
             
         except Exception as e:
-            logger.debug(f"Error parsing unit info HTML: {e}")
+            logger.debug("Error parsing unit info HTML: %s", e)
             return {'adaptor_info': {}, 'unit_info': {}, 'parse_error': str(e)}
 
     def close(self):
-        """Close the session"""
-        if self.session:
-            self.session.close()
+        """Close the pooled connection(s)"""
+        self._pool.clear()
@@ -13,12 +13,16 @@ from enum import Enum
 import logging
 from datetime import datetime
 import json
+import struct
 
 from .mitsubishi_api import MitsubishiAPI
 from .mitsubishi_parser import PowerOnOff, ParsedDeviceState
 
 logger = logging.getLogger(__name__)
 
+# ProfileCode layout: group code, version info, feature flags, capability field
+_PROFILE_CODE_STRUCT = struct.Struct('>5xB3H')  # data[0:12]
+
 
 class CapabilityType(Enum):
     """Types of device capabilities"""
@@ -96,10 +100,7 @@ class DeviceCapabilities:
                 raise ValueError(f"Expected 22 bytes, got {len(data)}")
             
             # Parse the structure based on our analysis
-            group_code = data[5]
-            version_info = (data[6] << 8) | data[7]
-            feature_flags = (data[8] << 8) | data[9]
-            capability_field = (data[10] << 8) | data[11]
+            group_code, version_info, feature_flags, capability_field = _PROFILE_CODE_STRUCT.unpack_from(data)
             
             # Generic device type
             device_type = "generic_hvac"
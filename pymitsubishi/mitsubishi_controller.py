@@ -37,45 +37,45 @@ class MitsubishiController:
         """Fetch current device status and optionally detect capabilities"""
         response = self.api.send_status_request()
         if response:
-            self._parse_status_response(response)
+            # Parse the XML once; both the state and the capability detection work on the tree
+            try:
+                root = ET.fromstring(response)
+            except ET.ParseError as e:
+                logger.error(f"Error parsing status response: {e}")
+                return True
+
+            self._parse_status_response(root)
             
             # Optionally perform capability detection
             if detect_capabilities:
-                self._detect_capabilities_from_response(response)
+                self._detect_capabilities_from_response(root)
             
             return True
         return False
 
-    def _parse_status_response(self, response: str):
+    def _parse_status_response(self, root: ET.Element):
         """Parse the device status response and update state"""
-        try:
-            # Parse the XML response
-            root = ET.fromstring(response)
-            
-            # Extract code values for parsing
-            code_values_elems = root.findall('.//CODE/VALUE')
-            code_values = [bytes.fromhex(elem.text) for elem in code_values_elems if elem.text]
-            
-            # Use the parser module to get structured state
-            parsed_state = ParsedDeviceState.parse_code_values(code_values)
-            
-            if parsed_state:
-                self.state = parsed_state
-
-            # Extract and set device identity
-            mac_elem = root.find('.//MAC')
-            if mac_elem is not None:
-                self.state.mac = mac_elem.text
-                
-            serial_elem = root.find('.//SERIAL')
-            if serial_elem is not None:
-                self.state.serial = serial_elem.text
+        # Extract code values for parsing
+        code_values_elems = root.findall('.//CODE/VALUE')
+        code_values = [bytes.fromhex(elem.text) for elem in code_values_elems if elem.text]
+        
+        # Use the parser module to get structured state
+        parsed_state = ParsedDeviceState.parse_code_values(code_values)
+        
+        if parsed_state:
+            self.state = parsed_state
 
-        except ET.ParseError as e:
-            logger.error(f"Error parsing status response: {e}")
+        # Extract and set device identity
+        mac_elem = root.find('.//MAC')
+        if mac_elem is not None:
+            self.state.mac = mac_elem.text
+            
+        serial_elem = root.find('.//SERIAL')
+        if serial_elem is not None:
+            self.state.serial = serial_elem.text
     
-    def _detect_capabilities_from_response(self, response: str):
-        """Detect capabilities from the status response"""
+    def _detect_capabilities_from_response(self, root: ET.Element):
+        """Detect capabilities from the parsed status response"""
         try:
             logger.debug("🔍 Detecting capabilities from status response...")
             
@@ -83,9 +83,6 @@ class MitsubishiController:
             temp_detector = CapabilityDetector(api=self.api)
             temp_detector.capabilities = DeviceCapabilities()
             
-            # Parse the XML response for ProfileCode and other capability indicators
-            root = ET.fromstring(response)
-            
             # Extract basic device info
             mac_elem = root.find('.//MAC')
             if mac_elem is not None:
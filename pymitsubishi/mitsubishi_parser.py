@@ -7,19 +7,31 @@ including enums, state classes, and functions for decoding hex values.
 """
 
 from __future__ import annotations
-from enum import Enum
+from enum import Enum, IntEnum
 from dataclasses import dataclass
-from typing import Optional, Dict, Any, List
+from typing import TYPE_CHECKING, Optional, Dict, Any, List
 import logging
+import struct
+
+if TYPE_CHECKING:
+    from .mitsubishi_capabilities import DeviceCapabilities
 
 logger = logging.getLogger(__name__)
 
-class PowerOnOff(Enum):
+# Set to False to skip the FCC verification when deserializing trusted payloads
+VERIFY_CHECKSUMS = True
+
+class _ReprIntEnum(IntEnum):
+    """IntEnum that keeps the Enum str()/format() output ("PowerOnOff.ON")"""
+    __str__ = Enum.__str__
+    __format__ = Enum.__format__
+
+class PowerOnOff(_ReprIntEnum):
     OFF = 0
     ON = 1
     ON2 = 2
 
-class DriveMode(Enum):
+class DriveMode(_ReprIntEnum):
     AUTO = 0
     HEATER = 1
     DEHUM = 2
@@ -34,7 +46,7 @@ class WindSpeed(int):
             return "<WindSpeed.AUTO: 0>"
         return f"<WindSpeed.S{int(self)}: {int(self)}"
 
-class VerticalWindDirection(Enum):
+class VerticalWindDirection(_ReprIntEnum):
     AUTO = 0
     V1 = 1
     V2 = 2
@@ -43,7 +55,7 @@ class VerticalWindDirection(Enum):
     V5 = 5
     SWING = 7
 
-class HorizontalWindDirection(Enum):
+class HorizontalWindDirection(_ReprIntEnum):
     AUTO = 0
     L = 1
     LS = 2
@@ -56,7 +68,59 @@ class HorizontalWindDirection(Enum):
     LCR = 9
     LCR_S = 12
 
-@dataclass
+# Value -> member maps, to skip the Enum.__call__() machinery when deserializing
+_POWER_ON_OFF_MAP = PowerOnOff._value2member_map_
+_DRIVE_MODE_MAP = DriveMode._value2member_map_
+_VERTICAL_WIND_DIRECTION_MAP = VerticalWindDirection._value2member_map_
+_HORIZONTAL_WIND_DIRECTION_MAP = HorizontalWindDirection._value2member_map_
+
+# Member -> name maps for serialization, to skip the Enum.name descriptor
+_DRIVE_MODE_NAMES = {member: member.name for member in DriveMode}
+_VERTICAL_WIND_DIRECTION_NAMES = {member: member.name for member in VerticalWindDirection}
+_HORIZONTAL_WIND_DIRECTION_NAMES = {member: member.name for member in HorizontalWindDirection}
+
+# Mode-based base consumption (typical values for residential units)
+_MODE_BASE_WATTS = {
+    DriveMode.COOLER: 1200,     # Cooling tends to use more power
+    DriveMode.HEATER: 1000,     # Heating can be more efficient
+    DriveMode.AUTO: 1100,       # Average
+    DriveMode.DEHUM: 800,       # Dehumidification uses less
+    DriveMode.FAN: 50,          # Fan only
+    DriveMode.AUTO_COOLER: 1200,
+    DriveMode.AUTO_HEATER: 1000,
+}
+
+# Fan power, indexed by wind speed
+_FAN_POWER_WATTS = (
+    50,   # 0: Variable
+    30,   # 1: Low speed
+    60,   # 2: Medium-low
+    90,   # 3: Medium-high
+    120,  # 4: High speed
+)
+
+# Raw byte -> WindSpeed, so deserializing doesn't construct a new instance each time
+_WIND_SPEEDS = tuple(WindSpeed(value) for value in range(256))
+
+# Raw byte -> temperature lookup tables, indexed by the byte value
+_COARSE_TEMPERATURES = tuple(31 - value for value in range(256))
+_FINE_TEMPERATURES = tuple((value - 0x80) * 0.5 for value in range(256))
+
+# Fixed-offset field layouts of the state payloads (FCC excluded)
+_GENERAL_STATES_STRUCT = struct.Struct('>8x5B2x5B')  # data[0:20]
+_SENSOR_STATES_STRUCT = struct.Struct('>10xBxB6x2B')  # data[0:21]
+_ENERGY_STATES_STRUCT = struct.Struct('>9x2B')  # data[0:11]
+_ERROR_STATES_STRUCT = struct.Struct('>9xH')  # data[0:11]
+
+# Command payload prefixes
+_GENERAL_COMMAND_PREFIX = b'\x41\x01\x30\x10\x01'
+_EXTEND08_COMMAND_PREFIX = b'\x41\x01\x30\x10\x08'
+
+# Command payload layouts (leading 0xfc and trailing FCC excluded)
+_GENERAL_COMMAND_STRUCT = struct.Struct('>5s7B5x3B')  # payload[0:20]
+_EXTEND08_COMMAND_STRUCT = struct.Struct('>5sB2x4B8x')  # payload[0:20]
+
+@dataclass(slots=True)
 class GeneralStates:
     """Parsed general AC states from device response"""
     power_on_off: PowerOnOff = PowerOnOff.OFF
@@ -76,51 +140,48 @@ class GeneralStates:
     @staticmethod
     def is_general_states_payload(data: bytes) -> bool:
         """Check if payload contains general states data"""
-        if len(data) < 6:
-            return False
-        return data[1] in [0x62, 0x7b] and data[5] == 0x02
+        return _group_code(data) == 0x02
 
     @classmethod
     def deserialize(cls, data: bytes) -> GeneralStates:
-        logger.debug(f"GeneralState.deserialize: {data.hex()}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("GeneralState.deserialize: %s", data.hex())
         if len(data) < 21:
             raise ValueError("Data too short")
 
-        calculated_fcc = calc_fcc(data[1:-1])
-        if calculated_fcc != data[-1]:
-            raise ValueError(f"Checksum mismatch: got 0x{data[-1]:02x}, expected 0x{calculated_fcc:02x}")
-
-        obj = cls.__new__(cls)
+        if VERIFY_CHECKSUMS:
+            _check_fcc(data)
 
         # Compared to the SwiCago implementation, we have an offset of 5:
         # SwiCago's data[0] is our data[5]
-        obj._unknown0 = data[0:8]
-
-        obj.power_on_off = PowerOnOff(data[8])
-
-        # Enhanced mode parsing with i-See sensor detection
-        obj.drive_mode = DriveMode(data[9] & 0x07)
-        obj.i_see_sensor = bool(data[9] & 0x08)
-        obj._unknown9 = data[9] & 0xF0
-
-        obj.coarse_temperature = cls._from_coarse_temperature(data[10])
-        obj.wind_speed = WindSpeed(data[11])
-        obj.vertical_wind_direction = VerticalWindDirection(data[12])
-
-        obj._unknown13 = data[13:15]
-
-        wide_vane_data = data[15]
-        obj.horizontal_wind_direction = HorizontalWindDirection(wide_vane_data & 0x0F)  # Lower 4 bits
-        obj.wide_vane_adjustment = (wide_vane_data & 0xF0) == 0x80  # Upper 4 bits = 0x80
-
-        obj.fine_temperature = cls._from_fine_temperature(data[16])
-        obj.dehum_setting = data[17]
-        obj.is_power_saving = data[18] > 0
-        obj.wind_and_wind_break_direct = data[19]
-
-        obj._unknown20 = data[20:]
-
-        return obj
+        (
+            power_on_off, mode, coarse_temperature, wind_speed, vertical_wind_direction,  # 8:13
+            wide_vane_data, fine_temperature, dehum_setting, power_saving, wind_and_wind_break,  # 15:20
+        ) = _GENERAL_STATES_STRUCT.unpack_from(data)
+
+        try:
+            power_on_off = _POWER_ON_OFF_MAP[power_on_off]
+            # Enhanced mode parsing with i-See sensor detection
+            drive_mode = _DRIVE_MODE_MAP[mode & 0x07]
+            vertical_wind_direction = _VERTICAL_WIND_DIRECTION_MAP[vertical_wind_direction]
+            horizontal_wind_direction = _HORIZONTAL_WIND_DIRECTION_MAP[wide_vane_data & 0x0F]  # Lower 4 bits
+        except KeyError as e:
+            raise ValueError(f"Invalid enum value {e.args[0]!r}") from None
+
+        return cls(
+            power_on_off=power_on_off,
+            drive_mode=drive_mode,
+            coarse_temperature=_COARSE_TEMPERATURES[coarse_temperature],
+            fine_temperature=_FINE_TEMPERATURES[fine_temperature],
+            wind_speed=_WIND_SPEEDS[wind_speed],
+            vertical_wind_direction=vertical_wind_direction,
+            horizontal_wind_direction=horizontal_wind_direction,
+            dehum_setting=dehum_setting,
+            is_power_saving=power_saving > 0,
+            wind_and_wind_break_direct=wind_and_wind_break,
+            i_see_sensor=bool(mode & 0x08),
+            wide_vane_adjustment=(wide_vane_data & 0xF0) == 0x80,  # Upper 4 bits = 0x80
+        )
 
     def generate_general_command(self, controls: Dict[str, bool]) -> bytes:
         # Calculate segment 1 value (control flags)
@@ -143,23 +204,28 @@ class GeneralStates:
         if controls.get('outside_control', True):  # Default true
             control_flags2 |= 0x02
 
-        # Build payload
-        payload = b'\x41\x01\x30\x10\x01'  # 0:5
-        payload += control_flags.to_bytes(1)  # 5
-        payload += control_flags2.to_bytes(1)  # 6
-        payload += self.power_on_off.value.to_bytes(1)  # 7
-        payload += self.drive_mode.value.to_bytes(1)  # 8
-        payload += self._to_coarse_temperature(self.coarse_temperature).to_bytes(1)  # 9
-        payload += self.wind_speed.to_bytes(1)  # 10
-        payload += self.vertical_wind_direction.value.to_bytes(1)  # 11
-        payload += b'\0' * 5  # 12:17
-        payload += self.horizontal_wind_direction.value.to_bytes(1)  # 17
-        payload += self._to_fine_temperature(self.fine_temperature).to_bytes(1)  # 18
-        payload += b'\x41'  # 19
-
-        # Calculate and append FCC
-        fcc = calc_fcc(payload).to_bytes(1)
-        return b"\xfc" + payload + fcc
+        # Build the frame in place: 0xfc, payload, FCC
+        frame = bytearray(1 + _GENERAL_COMMAND_STRUCT.size + 1)
+        frame[0] = 0xfc
+        _GENERAL_COMMAND_STRUCT.pack_into(
+            frame, 1,
+            _GENERAL_COMMAND_PREFIX,  # 0:5
+            control_flags,  # 5
+            control_flags2,  # 6
+            self.power_on_off,  # 7
+            self.drive_mode,  # 8
+            self._to_coarse_temperature(self.coarse_temperature),  # 9
+            self.wind_speed,  # 10
+            self.vertical_wind_direction,  # 11
+            # 12:17 zero padding
+            self.horizontal_wind_direction,  # 17
+            self._to_fine_temperature(self.fine_temperature),  # 18
+            0x41,  # 19
+        )
+
+        # Calculate and fill in FCC
+        frame[-1] = calc_fcc(frame, 1, len(frame) - 1)
+        return bytes(frame)
 
     def generate_extend08_command(self: GeneralStates, controls: Dict[str, bool]) -> bytes:
         """Generate extend08 command for buzzer, dehum, power saving, etc."""
@@ -173,20 +239,27 @@ class GeneralStates:
         if controls.get('wind_and_wind_break'):
             segment_x_value |= 0x20
 
-        payload = b"\x41\x01\x30\x10\x08"  # 0:5
-        payload += segment_x_value.to_bytes(1)  # 5
-        payload += b"\0\0"  # 6:8
-        payload += (self.dehum_setting if controls.get('dehum') else 0).to_bytes(1)  # 8
-        payload += b'\x0a' if self.is_power_saving else b'\x00'  # 9
-        payload += (self.wind_and_wind_break_direct if controls.get('wind_and_wind_break') else 0).to_bytes(1)  # 10
-        payload += b'\x01' if controls.get('buzzer') else b'\x00'  # 11
-        payload += b"\x00" * 8  # 12:20
-        fcc = calc_fcc(payload).to_bytes(1)
-        return b'\xfc' + payload + fcc
+        frame = bytearray(1 + _EXTEND08_COMMAND_STRUCT.size + 1)
+        frame[0] = 0xfc
+        _EXTEND08_COMMAND_STRUCT.pack_into(
+            frame, 1,
+            _EXTEND08_COMMAND_PREFIX,  # 0:5
+            segment_x_value,  # 5
+            # 6:8 zero padding
+            self.dehum_setting if controls.get('dehum') else 0,  # 8
+            0x0a if self.is_power_saving else 0x00,  # 9
+            self.wind_and_wind_break_direct if controls.get('wind_and_wind_break') else 0,  # 10
+            0x01 if controls.get('buzzer') else 0x00,  # 11
+            # 12:20 zero padding
+        )
+        frame[-1] = calc_fcc(frame, 1, len(frame) - 1)
+        return bytes(frame)
 
     @staticmethod
     def _from_coarse_temperature(value: int) -> int:
-        return 31 - value
+        if not 0 <= value <= 0xff:
+            raise ValueError(f"Invalid temperature byte {value}")
+        return _COARSE_TEMPERATURES[value]
     @staticmethod
     def _to_coarse_temperature(temp: int) -> int:
         if not 16 <= temp <= 31:
@@ -195,12 +268,14 @@ class GeneralStates:
 
     @staticmethod
     def _from_fine_temperature(value: int) -> float:
-        return (value - 0x80) * 0.5
+        if not 0 <= value <= 0xff:
+            raise ValueError(f"Invalid temperature byte {value}")
+        return _FINE_TEMPERATURES[value]
     @staticmethod
     def _to_fine_temperature(temp: float | None) -> int:
         if temp is None:
             return 0x00
-        return 0x80 + int(temp // 0.5)
+        return 0x80 + int(temp * 2)
 
     @property
     def temperature(self) -> float:
@@ -209,7 +284,7 @@ class GeneralStates:
         return self.coarse_temperature
 
 
-@dataclass
+@dataclass(slots=True)
 class SensorStates:
     """Parsed sensor states from device response"""
     outside_temperature: float | None
@@ -220,38 +295,30 @@ class SensorStates:
     @staticmethod
     def is_sensor_states_payload(payload: bytes) -> bool:
         """Check if payload contains sensor states data"""
-        if len(payload) < 6:
-            return False
-        return payload[1] in [0x62, 0x7b] and payload[5] == 0x03
+        return _group_code(payload) == 0x03
 
     @classmethod
     def deserialize(cls, data: bytes) -> SensorStates:
         if len(data) < 21:
             raise ValueError("Payload too short")
 
-        calculated_fcc = calc_fcc(data[1:-1])
-        if calculated_fcc != data[-1]:
-            raise ValueError(f"Checksum mismatch: got 0x{data[-1]:02x}, expected 0x{calculated_fcc:02x}")
-
-        obj = cls.__new__(cls)
-
-        obj._unknown0 = data[0:10]
-        obj.outside_temperature = GeneralStates._from_fine_temperature(data[10])
-        obj._unknown11 = data[11]
-        obj.room_temperature = GeneralStates._from_fine_temperature(data[12])
-        obj._unknown13 = data[13:19]
-        obj.thermal_sensor = (data[19] & 0x01) != 0
-        obj._unknown19 = data[19] & 0xf7
-        obj.wind_speed_pr557 = 1 if (data[20] & 0x01) == 1 else 0
-        obj._unknown20 = data[20] & 0xf7
+        if VERIFY_CHECKSUMS:
+            _check_fcc(data)
 
-        if len(data) > 21:
-            obj._unknown21 = data[21:]
+        (
+            outside_temperature, room_temperature,  # 10:13
+            thermal_sensor, wind_speed_pr557,  # 19:21
+        ) = _SENSOR_STATES_STRUCT.unpack_from(data)
 
-        return obj
+        return cls(
+            outside_temperature=_FINE_TEMPERATURES[outside_temperature],
+            room_temperature=_FINE_TEMPERATURES[room_temperature],
+            thermal_sensor=(thermal_sensor & 0x01) != 0,
+            wind_speed_pr557=1 if (wind_speed_pr557 & 0x01) == 1 else 0,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class EnergyStates:
     """Parsed energy and operational states from device response"""
     compressor_frequency: Optional[int] = None  # Raw compressor frequency value
@@ -260,9 +327,7 @@ class EnergyStates:
     @staticmethod
     def is_energy_states_payload(payload: bytes) -> bool:
         """Check if payload contains energy/status data (SwiCago group 06)"""
-        if len(payload) < 6:
-            return False
-        return payload[1] in [0x62, 0x7b] and payload[5] == 0x06
+        return _group_code(payload) == 0x06
 
     @classmethod
     def deserialize(cls, data: bytes, general_states: Optional[GeneralStates] = None) -> EnergyStates:
@@ -274,26 +339,24 @@ class EnergyStates:
 
         Args:
             data: payload bytes
-            general_states: Optional general states for power estimation context
+            general_states: Ignored; kept for backward compatibility (power
+                            estimation lives in ParsedDeviceState)
         """
         if len(data) < 12:  # Need at least enough bytes for data[4]
             raise ValueError("Payload too short")
 
-        calculated_fcc = calc_fcc(data[1:-1])
-        if calculated_fcc != data[-1]:
-            raise ValueError(f"Checksum mismatch: got 0x{data[-1]:02x}, expected 0x{calculated_fcc:02x}")
+        if VERIFY_CHECKSUMS:
+            _check_fcc(data)
 
-        obj = cls.__new__(cls)
+        compressor_frequency, operating = _ENERGY_STATES_STRUCT.unpack_from(data)
 
-        obj._unknown0 = data[0:9]
-        obj.compressor_frequency = data[9]
-        obj.operating = data[10]
-        obj._unknown11 = data[11:]
+        return cls(
+            compressor_frequency=compressor_frequency,
+            operating=operating,
+        )
 
-        return obj
 
-
-@dataclass 
+@dataclass(slots=True)
 class ErrorStates:
     """Parsed error states from device response"""
     error_code: int = 0x8000
@@ -301,34 +364,35 @@ class ErrorStates:
     @staticmethod
     def is_error_states_payload(payload: bytes) -> bool:
         """Check if payload contains error states data"""
-        if len(payload) < 6:
-            return False
-        return payload[1] in [0x62, 0x7b] and payload[5] == 0x04
+        return _group_code(payload) == 0x04
 
     @classmethod
     def deserialize(cls, data: bytes) -> ErrorStates:
         if len(data) < 11:
             raise ValueError("Payload too short")
 
-        calculated_fcc = calc_fcc(data[1:-1])
-        if calculated_fcc != data[-1]:
-            raise ValueError(f"Checksum mismatch: got 0x{data[-1]:02x}, expected 0x{calculated_fcc:02x}")
-
-        obj = cls.__new__(cls)
+        if VERIFY_CHECKSUMS:
+            _check_fcc(data)
 
-        obj._unknown0 = data[0:9]
-        obj.error_code = int.from_bytes(data[9:11], byteorder="big", signed=False)
-        if len(data) > 11:
-            obj._unknown11 = data[11:]
+        error_code, = _ERROR_STATES_STRUCT.unpack_from(data)
 
-        return obj
+        return cls(error_code=error_code)
 
     @property
     def is_abnormal_state(self):
         return self.error_code != 0x8000
 
 
-@dataclass
+# Group code (payload[5]) -> (ParsedDeviceState attribute, states class)
+_STATES_BY_GROUP_CODE = {
+    0x02: ('general', GeneralStates),
+    0x03: ('sensors', SensorStates),
+    0x04: ('errors', ErrorStates),
+    0x06: ('energy', EnergyStates),
+}
+
+
+@dataclass(slots=True)
 class ParsedDeviceState:
     """Complete parsed device state combining all state types"""
     general: Optional[GeneralStates] = None
@@ -339,6 +403,7 @@ class ParsedDeviceState:
     serial: str = ""
     rssi: str = ""
     app_version: str = ""
+    capabilities: Optional[DeviceCapabilities] = None
 
     @classmethod
     def parse_code_values(cls, code_values: List[bytes]) -> ParsedDeviceState:
@@ -346,21 +411,24 @@ class ParsedDeviceState:
         parsed_state = ParsedDeviceState()
 
         for value in code_values:
-            # Parse different payload types
-            if GeneralStates.is_general_states_payload(value):
-                parsed_state.general = GeneralStates.deserialize(value)
-            elif SensorStates.is_sensor_states_payload(value):
-                parsed_state.sensors = SensorStates.deserialize(value)
-            elif ErrorStates.is_error_states_payload(value):
-                parsed_state.errors = ErrorStates.deserialize(value)
-            elif EnergyStates.is_energy_states_payload(value):
-                # Parse energy states with context from general states if available
-                parsed_state.energy = EnergyStates.deserialize(value, parsed_state.general)
+            # Dispatch on the group code
+            handler = _STATES_BY_GROUP_CODE.get(_group_code(value))
+            if handler is not None:
+                attribute, states_cls = handler
+                setattr(parsed_state, attribute, states_cls.deserialize(value))
 
         return parsed_state
 
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization"""
+    def to_dict(self, out: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization
+
+        Args:
+            out: Optional dict from a previous call to update in place, so
+                 periodic exporters can keep reusing the same (nested) dicts
+        """
+        if out is not None:
+            return self._update_dict(out)
+
         result = {
             'device_info': {
                 'mac': self.mac,
@@ -373,12 +441,11 @@ class ParsedDeviceState:
         if self.general:
             result['general_states'] = {
                 'power': 'ON' if self.general.power_on_off == PowerOnOff.ON else 'OFF',
-                'mode': self.general.drive_mode.name,
+                'mode': _DRIVE_MODE_NAMES[self.general.drive_mode],
                 'target_temperature_celsius': self.general.temperature,
-                'fan_speed': self.general.wind_speed.name,
-                'vertical_wind_direction_right': self.general.vertical_wind_direction_right.name,
-                'vertical_wind_direction_left': self.general.vertical_wind_direction_left.name,
-                'horizontal_wind_direction': self.general.horizontal_wind_direction.name,
+                'fan_speed': int(self.general.wind_speed),
+                'vertical_wind_direction': _VERTICAL_WIND_DIRECTION_NAMES[self.general.vertical_wind_direction],
+                'horizontal_wind_direction': _HORIZONTAL_WIND_DIRECTION_NAMES[self.general.horizontal_wind_direction],
                 'dehumidification_setting': self.general.dehum_setting,
                 'power_saving_mode': self.general.is_power_saving,
                 'wind_and_wind_break_direct': self.general.wind_and_wind_break_direct,
@@ -404,11 +471,63 @@ class ParsedDeviceState:
             result['energy_states'] = {
                 'compressor_frequency': self.energy.compressor_frequency,
                 'operating': self.energy.operating,
-                'estimated_power_watts': self.energy.estimated_power_watts,
+                # The estimate depends on the drive mode and fan speed
+                'estimated_power_watts': self.estimate_power_consumption() if self.general else None,
             }
             
         return result
 
+    def _update_dict(self, out: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill `out` like to_dict() does, writing into the section dicts it already holds"""
+        section = _section(out, 'device_info')
+        section['mac'] = self.mac
+        section['serial'] = self.serial
+        section['rssi'] = self.rssi
+        section['app_version'] = self.app_version
+
+        if self.general:
+            section = _section(out, 'general_states')
+            section['power'] = 'ON' if self.general.power_on_off == PowerOnOff.ON else 'OFF'
+            section['mode'] = _DRIVE_MODE_NAMES[self.general.drive_mode]
+            section['target_temperature_celsius'] = self.general.temperature
+            section['fan_speed'] = int(self.general.wind_speed)
+            section['vertical_wind_direction'] = _VERTICAL_WIND_DIRECTION_NAMES[self.general.vertical_wind_direction]
+            section['horizontal_wind_direction'] = _HORIZONTAL_WIND_DIRECTION_NAMES[self.general.horizontal_wind_direction]
+            section['dehumidification_setting'] = self.general.dehum_setting
+            section['power_saving_mode'] = self.general.is_power_saving
+            section['wind_and_wind_break_direct'] = self.general.wind_and_wind_break_direct
+            # Enhanced functionality
+            section['i_see_sensor_active'] = self.general.i_see_sensor
+        else:
+            out.pop('general_states', None)
+
+        if self.sensors:
+            section = _section(out, 'sensor_states')
+            section['room_temperature_celsius'] = self.sensors.room_temperature
+            section['outside_temperature_celsius'] = self.sensors.outside_temperature
+            section['thermal_sensor_active'] = self.sensors.thermal_sensor
+            section['wind_speed_pr557'] = self.sensors.wind_speed_pr557
+        else:
+            out.pop('sensor_states', None)
+
+        if self.errors:
+            section = _section(out, 'error_states')
+            section['abnormal_state'] = self.errors.is_abnormal_state
+            section['error_code'] = self.errors.error_code
+        else:
+            out.pop('error_states', None)
+
+        if self.energy:
+            section = _section(out, 'energy_states')
+            section['compressor_frequency'] = self.energy.compressor_frequency
+            section['operating'] = self.energy.operating
+            # The estimate depends on the drive mode and fan speed
+            section['estimated_power_watts'] = self.estimate_power_consumption() if self.general else None
+        else:
+            out.pop('energy_states', None)
+
+        return out
+
     def estimate_power_consumption(self) -> float:
         """Estimate power consumption based on compressor frequency and operational parameters
 
@@ -426,32 +545,14 @@ class ParsedDeviceState:
         # This is a rough linear approximation - real curves are more complex
         frequency_factor = self.energy.compressor_frequency / 255.0  # Normalize to 0-1
 
-        # Mode-based base consumption (typical values for residential units)
-        mode_base_watts = {
-            DriveMode.COOLER: 1200,     # Cooling tends to use more power
-            DriveMode.HEATER: 1000,     # Heating can be more efficient
-            DriveMode.AUTO: 1100,       # Average
-            DriveMode.DEHUM: 800,       # Dehumidification uses less
-            DriveMode.FAN: 50,          # Fan only
-            DriveMode.AUTO_COOLER: 1200,
-            DriveMode.AUTO_HEATER: 1000,
-        }
-
-        base_power = mode_base_watts.get(self.general.drive_mode, 1000)
+        base_power = _MODE_BASE_WATTS.get(self.general.drive_mode, 1000)
 
         # Compressor power scales roughly with frequency
         compressor_power = base_power * frequency_factor
 
         # Fan power addition
-        fan_power_map = {
-            0: 50,      # Variable
-            1: 30,   # Low speed
-            2: 60,   # Medium-low
-            3: 90,   # Medium-high
-            4: 120, # High speed
-        }
-
-        fan_power = fan_power_map.get(self.general.wind_speed, 50)
+        wind_speed = self.general.wind_speed
+        fan_power = _FAN_POWER_WATTS[wind_speed] if 0 <= wind_speed < len(_FAN_POWER_WATTS) else 50
 
         # Total estimated power
         total_power = compressor_power + fan_power + 20  # +20W for control electronics
@@ -459,6 +560,36 @@ class ParsedDeviceState:
         return round(total_power, 1)
 
 
-def calc_fcc(payload: bytes) -> int:
-    """Calculate FCC checksum for Mitsubishi protocol payload"""
-    return 0x100 - (sum(payload[0:20]) % 0x100)  # TODO: do we actually need to limit this to 20 bytes?
+def _group_code(payload: bytes) -> int | None:
+    """Return the group code of a response payload, or None if it isn't one"""
+    if len(payload) < 6 or payload[1] not in (0x62, 0x7b):
+        return None
+    return payload[5]
+
+
+def _section(result: Dict[str, Any], key: str) -> Dict[str, Any]:
+    """Return the dict stored under `key`, adding an empty one if there is none yet"""
+    section = result.get(key)
+    if section is None:
+        section = result[key] = {}
+    return section
+
+
+def _check_fcc(data: bytes) -> None:
+    """Raise ValueError if the trailing FCC byte of `data` doesn't match"""
+    calculated_fcc = calc_fcc(data, 1, len(data) - 1)
+    if calculated_fcc != data[-1]:
+        raise ValueError(f"Checksum mismatch: got 0x{data[-1]:02x}, expected 0x{calculated_fcc:02x}")
+
+
+def calc_fcc(payload: bytes | bytearray | memoryview, start: int = 0, end: int | None = None) -> int:
+    """Calculate FCC checksum for Mitsubishi protocol payload
+
+    The checksum covers payload[start:end], limited to 20 bytes.
+    """
+    # TODO: do we actually need to limit this to 20 bytes?
+    limit = start + 20
+    if end is None or end > limit:
+        end = limit
+    # memoryview slicing doesn't copy the bytes
+    return (-sum(memoryview(payload)[start:end])) & 0xFF
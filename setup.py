@@ -11,8 +11,8 @@ setup(
     url='https://github.com/pymitsubishi/pymitsubishi',
     packages=find_packages(),
     install_requires=[
-        'requests',
-        'pycryptodome',
+        'urllib3',
+        'cryptography',
     ],
     extras_require={
         'dev': [
@@ -22,3 +22,60 @@ def test_encrypt(plain, iv, cipher):
 
     dec = api.decrypt_payload(enc)
     assert dec == plain
+
+
+@pytest.mark.parametrize(
+    'cipher',
+    [
+        "",
+        "AAAAAAAAAAAAAAAAAAAAAA==",  # IV only
+        "AAAAAAAAAAAAAAAAAAAAAIT5vD/rsXTBfN0pB8TPkw==",  # truncated block
+    ],
+)
+def test_decrypt_malformed(cipher):
+    api = MitsubishiAPI("localhost")
+    assert api.decrypt_payload(cipher) is None
+
+
+UNIT_INFO_HTML = """<html><body>
+<dl>
+<dt>Adaptor name</dt><dd>MAC-577IF-2E</dd>
+<dt>Application version</dt><dd>33.00</dd>
+<dt class="label">Release version</dt> <dd class="value"> 00.06 </dd>
+<dt>MAC address</dt><dd>AA:BB:CC:DD:EE:FF</dd>
+<dt>ID</dt><dd>1234567890</dd>
+<dt>Channel</dt><dd>auto</dd>
+<dt>RSSI</dt><dd>-25dBm</dd>
+<dt>Server operation</dt><dd>ON</dd>
+<dt>Thermal image timestamp</dt><dd>--</dd>
+<dt>Some new field</dt><dd>whatever</dd>
+</dl>
+<dl>
+<dt>Unit type</dt>
+<dd>RAC</dd>
+<dt>Error</dt><dd>8000</dd>
+</dl>
+</body></html>"""
+
+
+def test_parse_unit_info_html():
+    api = MitsubishiAPI("localhost")
+    info = api._parse_unit_info_html(UNIT_INFO_HTML)
+    assert info == {
+        'adaptor_info': {
+            'model': 'MAC-577IF-2E',
+            'app_version': '33.00',
+            'release_version': '00.06',
+            'mac_address': 'AA:BB:CC:DD:EE:FF',
+            'device_id': 1234567890,
+            'wifi_channel_raw': 'auto',
+            'rssi_dbm': -25,
+            'rssi_raw': '-25dBm',
+            'server_operation': True,
+            'thermal_timestamp': None,
+        },
+        'unit_info': {
+            'type': 'RAC',
+            'error_code': '8000',
+        },
+    }
@@ -27,3 +27,8 @@ SAMPLE_CODE_VALUES = [
     "ffffffffffffffffffff0a02008000",  # Group code 0a
 ]
 
+SAMPLE_CODE_VALUES_BYTES = [bytes.fromhex(code) for code in SAMPLE_CODE_VALUES]
+SAMPLE_PROFILE_CODES_BYTES = [bytes.fromhex(code) for code in SAMPLE_PROFILE_CODES]
+
+# General states frame reused across tests: on, cooler, 24ºC, auto fan, centered horizontal vane
+GENERAL_STATES_ON_COOLER_24 = bytes.fromhex('fc62013010020000010b070000000083b046000000cf')
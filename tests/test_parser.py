@@ -7,13 +7,13 @@ collected from real Mitsubishi MAC-577IF-2E devices.
 
 import pytest
 
-from pymitsubishi import SensorStates
+from pymitsubishi import SensorStates, mitsubishi_parser
 from pymitsubishi.mitsubishi_parser import (
     calc_fcc,
-    GeneralStates, ParsedDeviceState,
+    GeneralStates, ParsedDeviceState, ErrorStates,
 )
 
-from .test_fixtures import SAMPLE_CODE_VALUES
+from .test_fixtures import GENERAL_STATES_ON_COOLER_24, SAMPLE_CODE_VALUES_BYTES
 
 
 @pytest.mark.parametrize(
@@ -23,6 +23,7 @@ from .test_fixtures import SAMPLE_CODE_VALUES
         (b"\x01\x02\x03\x04\x05\x06\x07\x08\x09\x10\x11\x12\x13\x14\x15\x16\x17\x18\x19", 0x06), # Sample command
         (b"\xff\xff\xff\xff\xff\xff\xff\xff\xff\xff\x02\x02\x00\x80\x00\x00\x00\x00", 0x86),  # Real code pattern
         (b"\xa0\xbe\xa0\xbe\xa0\xbe\xa0\xbe\xa0\xbe\xa0\xbe\xa0\xbe\xa0\xbe\xa0\xbe", 0xb2),  # Profile code pattern
+        (b"\x80\x80", 0x00),  # Sum is a multiple of 0x100
     ],
 )
 def test_fcc(payload, expected):
@@ -30,6 +31,12 @@ def test_fcc(payload, expected):
     assert checksum == expected
 
 
+def test_fcc_offsets():
+    frame = bytes.fromhex('fc620130100300000f00b4b2b2fe420001141a0000c4')
+    assert calc_fcc(frame, 1, len(frame) - 1) == frame[-1]
+    assert calc_fcc(frame, 1, len(frame) - 1) == calc_fcc(frame[1:-1])
+
+
 def test_generate_general_command():
     command = GeneralStates().generate_general_command({})
     assert command.hex() == "fc410130100100020000090000000000000000ac4185"
@@ -43,26 +50,61 @@ def test_parse_sensor_states():
     assert states.outside_temperature == 26.0
     assert states.room_temperature == 25.0
 
+def test_checksum_verification(monkeypatch):
+    corrupted = bytes.fromhex('fc620130100300000f00b4b2b2fe420001141a0000c5')
+    with pytest.raises(ValueError):
+        SensorStates.deserialize(corrupted)
+
+    monkeypatch.setattr(mitsubishi_parser, 'VERIFY_CHECKSUMS', False)
+    assert SensorStates.deserialize(corrupted).room_temperature == 25.0
+
+def test_to_dict_reuses_out():
+    state = ParsedDeviceState(
+        sensors=SensorStates.deserialize(bytes.fromhex('fc620130100300000f00b4b2b2fe420001141a0000c4')),
+        mac="AA:BB:CC:DD:EE:FF",
+    )
+    out = state.to_dict()
+    device_info = out['device_info']
+
+    state.sensors = None
+    state.errors = ErrorStates(error_code=0x8000)
+    assert state.to_dict(out) is out
+    assert out['device_info'] is device_info
+    assert 'sensor_states' not in out
+    assert out['error_states'] == {'abnormal_state': False, 'error_code': 0x8000}
+    assert out == state.to_dict()
+
+def test_to_dict():
+    state = ParsedDeviceState.parse_code_values([
+        GENERAL_STATES_ON_COOLER_24,
+        bytes.fromhex('fc620130100300000d00a8aeaefe42000114520000a2'),
+        bytes.fromhex('fc6201301004000000800000000000000000000000d9'),
+        bytes.fromhex('fc620130100600000000001d5178000042000000002f'),
+    ])
+    result = state.to_dict()
+    assert result['general_states']['power'] == 'ON'
+    assert result['general_states']['mode'] == 'COOLER'
+    assert result['general_states']['fan_speed'] == 0
+    assert result['general_states']['vertical_wind_direction'] == 'AUTO'
+    assert result['general_states']['horizontal_wind_direction'] == 'C'
+    assert result['sensor_states']['room_temperature_celsius'] == 23.0
+    assert result['error_states']['abnormal_state'] is False
+    assert result['energy_states']['estimated_power_watts'] == 10.0
+    assert state.to_dict({}) == result
+
 class TestCodeValueParsing:
     """Test parsing of real CODE values from device responses."""
 
     def test_code_values_parsing(self):
         """Test parsing of complete code value arrays."""
         # Test that parse_code_values can handle real code arrays
-        parsed_state = ParsedDeviceState.parse_code_values([
-            bytes.fromhex(code)
-            for code in SAMPLE_CODE_VALUES
-        ])
+        parsed_state = ParsedDeviceState.parse_code_values(SAMPLE_CODE_VALUES_BYTES)
         
         # Should return a ParsedDeviceState or None
         assert isinstance(parsed_state, ParsedDeviceState)
         
         # If parsing succeeds, verify structure
         if parsed_state and parsed_state.general:
-            assert hasattr(parsed_state.general, 'power_on_off')
-            assert hasattr(parsed_state.general, 'drive_mode')
-            assert hasattr(parsed_state.general, 'temperature')
-
-
-if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+            assert parsed_state.general.power_on_off is not None
+            assert parsed_state.general.drive_mode is not None
+            assert parsed_state.general.temperature is not None